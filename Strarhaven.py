@@ -12,36 +12,47 @@
 # ==============================
 
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
-import json, os, random, textwrap
+from dataclasses import dataclass
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+import json, os, random, re, sys, textwrap
+try:
+    import orjson  # optional: faster save/load
+except ImportError:
+    orjson = None
 
 # ------- Utilities -------
-def wrap(s:str): return "\n".join(textwrap.wrap(s, width=88))
+_WRAPPER = textwrap.TextWrapper(width=88)  # reused: say() runs on nearly every action
+def wrap(s:str): return "\n".join(_WRAPPER.wrap(s))
 def say(s:str=""): print(wrap(s) if s else "")
+def phrase(words) -> str: return sys.intern(" ".join(words).lower())  # interned: index keys match by identity
+def dumps(obj) -> bytes: return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
+def loads(b:bytes): return orjson.loads(b) if orjson else json.loads(b)
 
-# ------- World Data -------
-DIRS = {"n":(0,-1),"s":(0,1),"e":(1,0),"w":(-1,0)}
+# Command word (multi-word commands matched whole) + optional argument text
+_CMD_RE = re.compile(r"^\s*(use\s+console|\S+)(?:\s+(.*))?$", re.IGNORECASE)
 
-@dataclass
-class Item:
+# ------- World Data -------
+# Directions by index (listing order for exits)
+DNAME = ("n","s","e","w")
+DX    = ( 0,  0,  1, -1)
+DY    = (-1,  1,  0,  0)
+
+# Items and room layouts never change once built; mutable room state lives
+# in Game.room_items / Game.room_npcs, indexed like Game.static_rooms.
+class Item(NamedTuple):
     id: str
     name: str
     desc: str
     portable: bool = True
 
-@dataclass
-class Room:
+class StaticRoom(NamedTuple):
     id: str
     name: str
     desc: str
     x: int
     y: int
-    items: List[str] = field(default_factory=list)
-    npcs: List[str] = field(default_factory=list)
-    passable: bool = True
 
-@dataclass
+@dataclass(slots=True)
 class NPC:
     id: str
     name: str
@@ -57,27 +68,64 @@ class Game:
     def __init__(self, seed: Optional[int]=None):
         self.rng = random.Random(seed)
         self.time = 60  # minutes until stellar impact
-        self.rooms: Dict[str, Room] = {}
+        self.static_rooms: Tuple[StaticRoom,...] = ()  # by room index
+        self.room_items: List[List[str]] = []  # room index -> item_ids
+        self.room_npcs: List[List[str]] = []   # room index -> free (unarrested) npc_ids
+        self._room_idx: Dict[str,int] = {}     # room_id -> room index
         self.items: Dict[str, Item] = {}
         self.npcs: Dict[str, NPC] = {}
-        self.player_room = "atrium"
         self.inv: List[str] = []
         self.killer_id: str = ""
         self.killer_evidence: Dict[str,List[str]] = {}  # npc_id -> list of item_ids
+        self._evidence_names_joined: Dict[str,str] = {}  # npc_id -> "Item, Item, Item"
+        self._killer_evidence_set: frozenset = frozenset()
+        self._arrested_count = 0
         self.brigrm = "brig"
         self.cmdrm  = "command"
         self._build_world()
+        self.player_room = "atrium"
         self._seed_case()
+        # Save payload skeleton, refilled in place by save()
+        self._save_scratch = dict(
+            time=0, player_room="", inv=[],
+            rooms={rid:dict(items=None, npcs=None) for rid in self._room_idx},
+            npcs={nid:dict(room=None, arrested=False, coop=True) for nid in self.npcs},
+            killer="", killer_evidence={},
+        )
+        # Parser dispatch: command word -> handler(args)
+        self._cmds: Dict[str, Callable[[List[str]], None]] = {
+            "help": lambda a: self.show_help(),
+            "look": lambda a: self.look(),
+            "map": lambda a: self.show_map(),
+            "time": lambda a: self.show_time(),
+            "go": self._go, "move": self._go,
+            "take": lambda a: self.take(*a),
+            "drop": lambda a: self.drop(*a),
+            "inv": lambda a: self.inv_show(), "inventory": lambda a: self.inv_show(),
+            "inspect": lambda a: self.inspect(*a),
+            "talk": lambda a: self.talk(*a),
+            "accuse": lambda a: self.accuse(*a),
+            "arrest": lambda a: self.arrest(*a),
+            "use console": lambda a: self.use_console(),
+            "save": lambda a: self.save(),
+            "load": lambda a: self.load(),
+        }
 
     # ----- World Setup -----
-    def _add_room(self, id, name, desc, x, y, items=None, npcs=None):
-        self.rooms[id] = Room(id, name, desc, x, y, items or [], npcs or [])
+    # ids are interned so every dict probe on them can match by identity
+    def _add_room(self, id, name, desc, x, y, items=None):
+        id = sys.intern(id)
+        self._room_idx[id] = len(self.static_rooms)
+        self.static_rooms += (StaticRoom(id, name, desc, x, y),)
+        self.room_items.append([sys.intern(i) for i in items or []])
 
     def _add_item(self, id, name, desc, portable=True):
+        id = sys.intern(id)
         self.items[id] = Item(id, name, desc, portable)
 
     def _add_npc(self, id, name, title, room, alibi, truth, lie):
-        self.npcs[id] = NPC(id, name, title, room, alibi, truth, lie)
+        id = sys.intern(id)
+        self.npcs[id] = NPC(id, name, title, sys.intern(room), alibi, truth, lie)
 
     def _build_world(self):
         # Map (5x3): y=0..2, x=0..4
@@ -110,6 +158,17 @@ class Game:
         self._add_room("observ","Observatory",
             "A darkened lens toward eternity. One pane bears a smeared print.", 0,0,
             items=["smeared_print"])
+        # Spatial index: (x,y) -> 1<<room index; bit set in passable_mask = open
+        self._coord_to_bit: Dict[Tuple[int,int], int] = {
+            (r.x,r.y):1<<i for i,r in enumerate(self.static_rooms)}
+        self.passable_mask: int = (1<<len(self.static_rooms))-1
+        self._build_exits()
+        # Deck plan labels; show_map only overlays the player marker
+        W = max(r.x for r in self.static_rooms)+1
+        H = max(r.y for r in self.static_rooms)+1
+        self._map_template: List[List[str]] = [["   "]*W for _ in range(H)]
+        for r in self.static_rooms:
+            self._map_template[r.y][r.x] = r.name.split()[0][:3].upper()
 
         # Items
         self._add_item("cuffs","Restraint Cuffs","Security-issue restraints. Required to arrest.")
@@ -152,6 +211,13 @@ class Game:
                       "Maintenance drone #7 tagged me on route S-Delta.",
                       "Chatting with donors in the Dome all evening.")
 
+        # Parser lookups: lowercased name or raw id -> id
+        self._item_by_name: Dict[str,str] = {sys.intern(it.name.lower()):iid for iid,it in self.items.items()}
+        self._item_by_name.update({iid:iid for iid in self.items})
+        self._npc_by_name: Dict[str,str] = {sys.intern(n.name.lower()):nid for nid,n in self.npcs.items()}
+        self._npc_by_name.update({nid:nid for nid in self.npcs})
+        self._index_npcs()
+
     def _seed_case(self):
         suspects = list(self.npcs.keys())
         self.killer_id = self.rng.choice(suspects)
@@ -169,20 +235,48 @@ class Game:
         # Scatter items somewhat plausibly
         movable = [iid for iid,it in self.items.items() if it.portable and iid!="codes_token"]
         # Distribute into random rooms (avoiding brig/command a bit)
-        drop_rooms = [rid for rid in self.rooms if rid not in (self.brigrm,self.cmdrm)]
-        for iid in movable:
-            # Keep initial authored placements but allow shuffle if not pre-placed
-            placed = any(iid in r.items for r in self.rooms.values())
-            if not placed:
-                self.rooms[self.rng.choice(drop_rooms)].items.append(iid)
+        drop_rooms = [i for i,r in enumerate(self.static_rooms) if r.id not in (self.brigrm,self.cmdrm)]
+        # Keep initial authored placements but allow shuffle if not pre-placed
+        placed = {iid for items in self.room_items for iid in items}
+        unplaced = [iid for iid in movable if iid not in placed]
+        for iid,i in zip(unplaced, self.rng.choices(drop_rooms, k=len(unplaced))):
+            self.room_items[i].append(iid)
+        self._index_case()
+
+    def _index_case(self):
+        # derived from killer/evidence; rebuilt on load
+        self._evidence_names_joined = {
+            sid:", ".join(self.items[e].name for e in ev) for sid,ev in self.killer_evidence.items()}
+        self._killer_evidence_set = frozenset(self.killer_evidence[self.killer_id])
+
+    def _build_exits(self):
+        # Exits only change with passability, so render each room's list once
+        self._exits: List[str] = [
+            ", ".join(DNAME[k] for k in range(4) if self._room_index_at(r.x+DX[k], r.y+DY[k]) is not None)
+            for r in self.static_rooms]
+
+    def _set_passable(self, rid:str, passable:bool):
+        bit = 1<<self._room_idx[rid]
+        self.passable_mask = self.passable_mask|bit if passable else self.passable_mask&~bit
+        self._build_exits()
 
     # ----- Core Loop Helpers -----
-    def room_at_xy(self, x,y) -> Optional[Room]:
-        for r in self.rooms.values():
-            if r.x==x and r.y==y and r.passable: return r
-        return None
+    def _room_index_at(self, x,y) -> Optional[int]:
+        bit = self._coord_to_bit.get((x,y), 0)
+        return bit.bit_length()-1 if bit & self.passable_mask else None
+
+    def room_at_xy(self, x,y) -> Optional[StaticRoom]:
+        i = self._room_index_at(x,y)
+        return None if i is None else self.static_rooms[i]
+
+    def current_room(self)->StaticRoom: return self.static_rooms[self.player_idx]
+
+    # player position is a room index; player_room is the id view used by saves
+    @property
+    def player_room(self) -> str: return self.static_rooms[self.player_idx].id
 
-    def current_room(self)->Room: return self.rooms[self.player_room]
+    @player_room.setter
+    def player_room(self, rid:str): self.player_idx = self._room_idx[rid]
 
     def spend(self, minutes:int=1):
         self.time = max(0, self.time - minutes)
@@ -192,35 +286,33 @@ class Game:
 
     # ----- I/O -----
     def look(self):
-        r = self.current_room()
+        here = self.player_idx
+        r = self.static_rooms[here]
         say(f"\n{r.name}\n{r.desc}")
-        if r.items:
-            say("Items here: " + ", ".join(self.items[i].name for i in r.items))
-        if r.npcs:
-            say("You see: " + ", ".join(self.npcs[n].name for n in r.npcs))
-        # exits
-        exits = []
-        for d,(dx,dy) in DIRS.items():
-            if self.room_at_xy(self.current_room().x+dx, self.current_room().y+dy):
-                exits.append(d)
-        say("Exits: " + ", ".join(exits) if exits else "No exits.")
+        items = self.room_items[here]
+        if items:
+            say("Items here: " + ", ".join(self.items[i].name for i in items))
+        npcs = self.room_npcs[here]
+        if npcs:
+            say("You see: " + ", ".join(self.npcs[n].name for n in npcs))
+        exits = self._exits[here]
+        say("Exits: " + exits if exits else "No exits.")
         self.spend(0)
 
     def show_map(self):
         # simple 5x3 grid rendering
-        xs = [r.x for r in self.rooms.values()]; ys = [r.y for r in self.rooms.values()]
-        W,H = max(xs)+1, max(ys)+1
-        grid = [["   "]*W for _ in range(H)]
-        for r in self.rooms.values():
-            label = r.name.split()[0][:3].upper()
-            grid[r.y][r.x] = label
-        px,py = self.current_room().x, self.current_room().y
-        grid[py][px] = "[X]"
+        r = self.current_room()
         say("\nSTARHAVEN DECK PLAN:")
-        for y in range(H):
-            say(" ".join(grid[y]))
+        for y,row in enumerate(self._map_template):
+            if y == r.y:
+                row = row[:]; row[r.x] = "[X]"
+            say(" ".join(row))
         self.spend(0)
 
+    def show_help(self):
+        say("Commands: help, look, map, go n/e/s/w, take [item], drop [item], inv, inspect [thing],")
+        say("          talk [name], accuse [name], arrest [name], use console, time, save, load, quit")
+
     def show_time(self):
         say(f"Time to solar impact: {self.time} minutes.")
         self.spend(0)
@@ -235,84 +327,82 @@ class Game:
     # ----- Actions -----
     def move(self, d:str):
         d = d.lower()
-        if d not in DIRS: say("Use: go n/e/s/w"); return
-        dx,dy = DIRS[d]
+        if d not in DNAME: say("Use: go n/e/s/w"); return
+        k = DNAME.index(d)
         r = self.current_room()
-        target = self.room_at_xy(r.x+dx, r.y+dy)
-        if not target:
+        target = self._room_index_at(r.x+DX[k], r.y+DY[k])
+        if target is None:
             say("Access denied or bulkhead sealed.")
             return
-        self.player_room = target.id
-        self._sync_npcs_in_room()
+        self.player_idx = target
         self.look()
         self.spend(2)
 
-    def _sync_npcs_in_room(self):
-        # ensure npc lists reflect current positions
-        for rid in self.rooms:
-            self.rooms[rid].npcs = [nid for nid,n in self.npcs.items() if n.room==rid and not n.arrested]
+    def _index_npcs(self):
+        # rebuild room -> npc lists from scratch (world build / load)
+        self.room_npcs = [[] for _ in self.static_rooms]
+        self._arrested_count = 0
+        for nid,n in self.npcs.items():
+            if n.arrested: self._arrested_count += 1
+            else: self.room_npcs[self._room_idx[n.room]].append(nid)
+
+    def _move_npc(self, nid:str, new_room:str):
+        n = self.npcs[nid]
+        here = self.room_npcs[self._room_idx[n.room]]
+        if nid in here: here.remove(nid)
+        n.room = new_room
+        if not n.arrested: self.room_npcs[self._room_idx[new_room]].append(nid)
 
     def take(self, *args):
         if not args: say("Take what?"); return
-        name = " ".join(args).lower()
-        r = self.current_room()
-        # find item by name
-        iid = None
-        for i in r.items:
-            if self.items[i].name.lower()==name or i==name: iid = i; break
-        if not iid: say("Not here."); return
+        name = phrase(args)
+        items = self.room_items[self.player_idx]
+        iid = self._item_by_name.get(name)
+        if iid not in items: say("Not here."); return
         it = self.items[iid]
         if not it.portable:
             say("It’s fixed in place.")
             return
-        r.items.remove(iid)
+        items.remove(iid)
         self.inv.append(iid)
         say(f"You take the {it.name}.")
         self.spend(1)
 
     def drop(self, *args):
         if not args: say("Drop what?"); return
-        name = " ".join(args).lower()
-        iid = None
-        for i in self.inv:
-            if self.items[i].name.lower()==name or i==name: iid = i; break
-        if not iid: say("You don’t have that."); return
+        name = phrase(args)
+        iid = self._item_by_name.get(name)
+        if iid not in self.inv: say("You don’t have that."); return
         self.inv.remove(iid)
-        self.current_room().items.append(iid)
+        self.room_items[self.player_idx].append(iid)
         say(f"You drop the {self.items[iid].name}.")
         self.spend(1)
 
     def inspect(self, *args):
         if not args: say("Inspect what?"); return
-        name = " ".join(args).lower()
+        name = phrase(args)
         # search inv then room
-        pool = list(self.inv)+list(self.current_room().items)
+        i = self._item_by_name.get(name)
+        if i in self.inv or i in self.room_items[self.player_idx]:
+            detail = self.items[i].desc
+            # Flavor: if an evidence item belongs to killer, hint slightly stronger
+            if i in self._killer_evidence_set:
+                detail += " (Something about this ties uncomfortably close to the killer.)"
+            say(detail)
+            self.spend(1); return
         # also allow inspecting visible NPC by id/name
-        for i in pool:
-            it = self.items[i]
-            if it.name.lower()==name or i==name:
-                detail = it.desc
-                # Flavor: if an evidence item belongs to killer, hint slightly stronger
-                if i in self.killer_evidence[self.killer_id]:
-                    detail += " (Something about this ties uncomfortably close to the killer.)"
-                say(detail)
-                self.spend(1); return
-        # inspect room / person
-        for nid in self.current_room().npcs:
+        nid = self._npc_by_name.get(name)
+        if nid in self.room_npcs[self.player_idx]:
             n = self.npcs[nid]
-            if n.name.lower()==name or nid==name:
-                say(f"{n.name}, {n.title}. {'Calm' if n.cooperative else 'Guarded'}.")
-                self.spend(1); return
+            say(f"{n.name}, {n.title}. {'Calm' if n.cooperative else 'Guarded'}.")
+            self.spend(1); return
         say("You find nothing notable.")
 
     def talk(self, *args):
         if not args: say("Talk to whom?"); return
-        who = " ".join(args).lower()
-        target_id = None
-        for nid in self.current_room().npcs:
-            n = self.npcs[nid]
-            if n.name.lower()==who or nid==who: target_id = nid; break
-        if not target_id: say("They aren’t here."); return
+        who = phrase(args)
+        target_id = self._npc_by_name.get(who)
+        if target_id not in self.room_npcs[self.player_idx]: say("They aren’t here."); return
         n = self.npcs[target_id]
         guilty = (target_id == self.killer_id)
         line = n.lie_when_guilty if guilty else n.truth_when_innocent
@@ -324,48 +414,42 @@ class Game:
 
     def accuse(self, *args):
         if not args: say("Accuse whom?"); return
-        who = " ".join(args).lower()
-        if who not in [nid for nid in self.npcs]:
-            # try match by name
-            matches = [nid for nid,n in self.npcs.items() if n.name.lower()==who]
-            if not matches: say("Not a listed guest."); return
-            who = matches[0]
+        who = phrase(args)
+        who = self._npc_by_name.get(who)
+        if not who: say("Not a listed guest."); return
         guilty = (who == self.killer_id)
-        tips = self.killer_evidence[self.killer_id]
         say(f"You lay out your case against {self.npcs[who].name}.")
         if guilty:
             say("They blanch. A vein ticks. The room chills.")
-            say(f"Key tells: {', '.join(self.items[e].name for e in tips)}.")
+            say(f"Key tells: {self._evidence_names_joined[self.killer_id]}.")
         else:
             say("They sneer. Those 'clues' don’t hold up. Doubt creeps in.")
         self.spend(3)
 
     def arrest(self, *args):
         if not args: say("Arrest whom?"); return
-        who = " ".join(args).lower()
+        who = phrase(args)
         # need cuffs
         if "cuffs" not in self.inv:
             say("You need Restraint Cuffs to arrest.")
             return
         # must be here
-        target_id = None
-        for nid in self.current_room().npcs:
-            n = self.npcs[nid]
-            if n.name.lower()==who or nid==who: target_id = nid; break
-        if not target_id: say("They aren’t here."); return
+        target_id = self._npc_by_name.get(who)
+        if target_id not in self.room_npcs[self.player_idx]: say("They aren’t here."); return
 
         n = self.npcs[target_id]
         if n.arrested:
             say("Already restrained.")
             return
         n.arrested = True
-        # Move to brig automatically
-        n.room = self.brigrm
-        self._sync_npcs_in_room()
+        self._arrested_count += 1
+        # Move to brig automatically (restrained, so off the visible lists)
+        self._move_npc(target_id, self.brigrm)
         # If correct killer, they carry non-portable codes_token now revealed in Brig
         if target_id == self.killer_id:
-            if "codes_token" not in self.rooms[self.brigrm].items:
-                self.rooms[self.brigrm].items.append("codes_token")
+            brig = self.room_items[self._room_idx[self.brigrm]]
+            if "codes_token" not in brig:
+                brig.append("codes_token")
         say(f"You restrain {n.name}. Security drones escort them to the Brig.")
         self.spend(3)
 
@@ -376,7 +460,7 @@ class Game:
         # Need killer arrested AND codes present in brig
         killer = self.killer_id
         kname = self.npcs[killer].name
-        codes_here = "codes_token" in self.rooms[self.brigrm].items
+        codes_here = "codes_token" in self.room_items[self._room_idx[self.brigrm]]
         if codes_here:
             say("You splice in the Master Codes Token from the Brig. The lockout shudders…")
             say("Trajectory control restored. Starhaven veers away from the sun.")
@@ -385,38 +469,47 @@ class Game:
             raise SystemExit
         else:
             say("Console flashes: 'DECRYPTION SEED REQUIRED — (ARREST PERPETRATOR)'.")
-            if any(n.arrested for n in self.npcs.values()):
+            if self._arrested_count:
                 say("Someone is in the Brig… but the console rejects their credentials.")
                 say("If you grabbed the wrong person, time is running out.")
             self.spend(1)
 
     # ----- Persistence -----
     def save(self, fn="starhaven_save.json"):
-        data = dict(
-            time=self.time,
-            player_room=self.player_room,
-            inv=self.inv,
-            rooms={rid:dict(items=r.items, npcs=r.npcs) for rid,r in self.rooms.items()},
-            npcs={nid:dict(room=n.room, arrested=n.arrested, coop=n.cooperative) for nid,n in self.npcs.items()},
-            killer=self.killer_id,
-            killer_evidence=self.killer_evidence,
-        )
-        with open(fn,"w") as f: json.dump(data,f)
+        data = self._save_scratch
+        data["time"] = self.time; data["player_room"] = self.player_room; data["inv"] = self.inv
+        for i,r in enumerate(self.static_rooms):
+            d = data["rooms"][r.id]; d["items"] = self.room_items[i]; d["npcs"] = self.room_npcs[i]
+        for nid,n in self.npcs.items():
+            d = data["npcs"][nid]; d["room"] = n.room; d["arrested"] = n.arrested; d["coop"] = n.cooperative
+        data["killer"] = self.killer_id; data["killer_evidence"] = self.killer_evidence
+        with open(fn,"wb") as f: f.write(dumps(data))
         say("Saved.")
 
     def load(self, fn="starhaven_save.json"):
         if not os.path.exists(fn):
             say("No save found."); return
-        with open(fn) as f: data=json.load(f)
-        self.time = data["time"]; self.player_room=data["player_room"]; self.inv=data["inv"]
+        with open(fn,"rb") as f: data=loads(f.read())
+        # ids parsed from JSON are fresh strings; intern them to match the world's keys
+        self.time = data["time"]; self.player_room=sys.intern(data["player_room"])
+        self.inv = [sys.intern(i) for i in data["inv"]]
         for rid,stuff in data["rooms"].items():
-            self.rooms[rid].items = stuff["items"]; self.rooms[rid].npcs = stuff["npcs"]
+            self.room_items[self._room_idx[rid]] = [sys.intern(i) for i in stuff["items"]]
         for nid,stuff in data["npcs"].items():
-            self.npcs[nid].room = stuff["room"]; self.npcs[nid].arrested=stuff["arrested"]; self.npcs[nid].cooperative=stuff["coop"]
-        self.killer_id=data["killer"]; self.killer_evidence=data["killer_evidence"]
+            self.npcs[nid].room = sys.intern(stuff["room"]); self.npcs[nid].arrested=stuff["arrested"]; self.npcs[nid].cooperative=stuff["coop"]
+        self._index_npcs()
+        self.killer_id = sys.intern(data["killer"])
+        self.killer_evidence = {sys.intern(nid):[sys.intern(e) for e in ev] for nid,ev in data["killer_evidence"].items()}
+        self._index_case()
         say("Loaded.")
 
     # ----- Parser -----
+    def _go(self, args:List[str]):
+        if not args: say("Go where? n/e/s/w"); return
+        self.move(args[0])
+
+    def _unknown(self, args:List[str]): say("Unrecognized. Try 'help'.")
+
     def run(self):
         say("Welcome to STARHAVEN. Type 'help' for commands.")
         self.look()
@@ -426,31 +519,12 @@ class Game:
             except (EOFError, KeyboardInterrupt):
                 say("\nGoodbye."); break
             if not cmdline: continue
-            parts = cmdline.split()
-            cmd, args = parts[0].lower(), parts[1:]
+            m = _CMD_RE.match(cmdline)
+            cmd = sys.intern(" ".join(m.group(1).lower().split()))
+            args = (m.group(2) or "").split()
 
             if cmd in ("quit","exit"): say("Goodbye."); break
-            elif cmd == "help":
-                say("Commands: help, look, map, go n/e/s/w, take [item], drop [item], inv, inspect [thing],")
-                say("          talk [name], accuse [name], arrest [name], use console, time, save, load, quit")
-            elif cmd == "look": self.look()
-            elif cmd == "map": self.show_map()
-            elif cmd == "time": self.show_time()
-            elif cmd in ("go","move"):
-                if not args: say("Go where? n/e/s/w"); continue
-                self.move(args[0])
-            elif cmd == "take": self.take(*args)
-            elif cmd == "drop": self.drop(*args)
-            elif cmd in ("inv","inventory"): self.inv_show()
-            elif cmd == "inspect": self.inspect(*args)
-            elif cmd == "talk": self.talk(*args)
-            elif cmd == "accuse": self.accuse(*args)
-            elif cmd == "arrest": self.arrest(*args)
-            elif cmd == "use" and args and args[0].lower()=="console": self.use_console()
-            elif cmd == "save": self.save()
-            elif cmd == "load": self.load()
-            else:
-                say("Unrecognized. Try 'help'.")
+            self._cmds.get(cmd, self._unknown)(args)
             # Soft reminders
             if self.time <= 15 and self.time>0:
                 say(f"(Alarms intensify: {self.time} minutes left.)")
@@ -1,5 +1,15 @@
 import random
 
+try:
+    import numpy as np  # optional: only needed for simulate_games
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange  # optional: compiled simulate_games
+except ImportError:
+    njit = None
+
 def guess_the_number():
     number_to_guess = random.randint(1, 100)
     number_of_guesses = 0
@@ -19,5 +29,52 @@ def guess_the_number():
             guessed = True
             print(f"Congratulations! You've guessed the number {number_to_guess} in {number_of_guesses} guesses!")
 
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _play_games_nb(secrets, out_counts):
+        for i in prange(len(secrets)):
+            lo, hi = 1, 100
+            number_of_guesses = 0
+            while True:
+                number_of_guesses += 1
+                guess = (lo + hi) // 2
+                if guess == secrets[i]:
+                    out_counts[i] = number_of_guesses
+                    break
+                elif guess < secrets[i]:
+                    lo = guess + 1
+                else:
+                    hi = guess - 1
+
+def simulate_games(n_games, seed=None):
+    """Play n_games with an optimal binary-search guesser in parallel.
+
+    Returns an int array holding the number of guesses each game took.
+    Uses a compiled, multithreaded kernel when numba is installed.
+    """
+    if np is None:
+        raise ImportError("simulate_games requires numpy")
+    rng = np.random.default_rng(seed)
+    secret = rng.integers(1, 101, n_games, dtype=np.int32)
+    if njit is not None:
+        number_of_guesses = np.empty(n_games, dtype=np.int32)
+        _play_games_nb(secret, number_of_guesses)
+        return number_of_guesses
+
+    lo = np.ones(n_games, dtype=np.int32)
+    hi = np.full(n_games, 100, dtype=np.int32)
+    number_of_guesses = np.zeros(n_games, dtype=np.int32)
+    playing = np.ones(n_games, dtype=bool)
+
+    # Every game is over after at most 7 rounds (2**7 > 100)
+    while playing.any():
+        guess = (lo + hi) // 2
+        number_of_guesses += playing
+        lo = np.where(guess < secret, guess + 1, lo)
+        hi = np.where(guess > secret, guess - 1, hi)
+        playing &= guess != secret
+
+    return number_of_guesses
+
 if __name__ == '__main__':
     guess_the_number()
\ No newline at end of file